@@ -1,10 +1,17 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Charts are only ever rendered to PNG; never probe for a GUI backend
 import matplotlib.pyplot as plt
 import seaborn as sns
 from imdb import IMDb, IMDbDataAccessError
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 import time
+import os
+import io
+import datetime
 
 # Virtual environment setup instructions
 st.sidebar.title('Setup Instructions')
@@ -15,66 +22,151 @@ st.sidebar.write("""
 4. Run the Streamlit app: `streamlit run app.py`
 """)
 
-# Load the dataset
-@st.cache_data
+CURRENT_YEAR = datetime.date.today().year
+CAGE = 'Nicolas Cage'
+
+# Columns used by the app; the rest of the CSV is never loaded
+COLUMNS = ['Title', 'Year', 'Genre', 'Rating', 'Metascore', 'Cast', 'Votes', 'Review Count']
+# Text columns are held as Arrow strings so the .str methods run in Arrow's compute kernels
+TEXT_COLUMNS = ['Title', 'Genre', 'Cast']
+# Narrowest dtypes that hold the values; nullable integers keep missing entries
+NUMERIC_DTYPES = {'Year': 'Int16', 'Rating': 'float32', 'Metascore': 'float32', 'Votes': 'Int32', 'Review Count': 'Int32'}
+DTYPES = {column: 'string[pyarrow]' for column in TEXT_COLUMNS} | NUMERIC_DTYPES
+
+# The Parquet copy of the CSV, or None when it is missing, older than the CSV, unreadable
+# or was written for other columns or dtypes by an earlier version of the app
+def read_parquet_copy(parquet_path, file_path):
+    if not os.path.exists(parquet_path) or os.path.getmtime(parquet_path) < os.path.getmtime(file_path):
+        return None
+    try:
+        df = pd.read_parquet(parquet_path, columns=COLUMNS)
+    except (OSError, ValueError):
+        return None  # Truncated file, or a column the copy does not have
+    if any(df[column].dtype != dtype for column, dtype in NUMERIC_DTYPES.items()):
+        return None
+    return df.astype(DTYPES)  # pandas 2 reads Arrow strings back as Python-backed strings
+
+# Load the dataset, converting the CSV to Parquet once so cold starts skip CSV parsing.
+# Held as a shared resource: nothing mutates it (filter_cage_movies copies), so it is never pickled or copied
+@st.cache_resource
 def load_data(file_path):
-    return pd.read_csv(file_path)
+    parquet_path = os.path.splitext(file_path)[0] + '.parquet'
+    df = read_parquet_copy(parquet_path, file_path)
+    if df is None:
+        # The C parser strips the separators in Votes and Review Count ("28,744") while it reads;
+        # it ignores thousands for nullable dtypes, so the numbers are narrowed right after
+        df = pd.read_csv(file_path, usecols=COLUMNS, thousands=',', dtype={column: 'string[pyarrow]' for column in TEXT_COLUMNS})
+        df = df.astype(NUMERIC_DTYPES)
+        try:
+            # Write beside the target and swap it in, so an interrupted write never leaves a truncated copy
+            df.to_parquet(parquet_path + '.tmp', compression='zstd')
+            os.replace(parquet_path + '.tmp', parquet_path)
+        except OSError:
+            pass  # Read-only deployments simply keep parsing the CSV
+    return df
 
-# Normalize and capitalize the data
+# Title-case a low-cardinality column once per distinct value instead of once per row
+def title_case_categories(series):
+    # Lowercasing first keeps the categories distinct after title-casing
+    series = series.str.strip().str.lower().astype('category')
+    return series.cat.rename_categories(series.cat.categories.str.title())
+
+# Normalize and capitalize the displayed columns (title() already lowercases the rest of each word).
+# Cast is only ever matched case-insensitively, so it is left as loaded
 def clean_data(df):
-    df['Title'] = df['Title'].str.lower().str.strip().str.title()
-    df['Genre'] = df['Genre'].str.lower().str.strip().str.title().str.split(',').str[0]
-    df['Director'] = df['Director'].str.lower().str.strip().str.title()
-    df['Cast'] = df['Cast'].str.lower().str.strip().str.title()
-    df['Votes'] = df['Votes'].str.replace(',', '').astype(float)
-    df['Review Count'] = pd.to_numeric(df['Review Count'], errors='coerce')
+    df['Title'] = df['Title'].str.strip().str.title()
+    df['Genre'] = title_case_categories(df['Genre'].str.extract(r'^([^,]*)', expand=False))
     return df
 
-# Validate movie years using IMDb
-def validate_year(row):
-    title = row['Title']
-    original_year = row['Year']
-    ia = IMDb()
-    try:
-        movies = ia.search_movie(title)
-        if movies:
-            for movie in movies:
-                ia.update(movie)
-                if 'Nicolas Cage' in [person['name'] for person in movie.get('cast', [])]:
-                    year = movie.get('year')
-                    if year and year != original_year:
-                        return year
-    except IMDbDataAccessError as e:
-        st.error(f"Error accessing data for {title}: {e}")
+# Keep only the movies Nicolas Cage appears in
+def filter_cage_movies(df):
+    return df[df['Cast'].str.contains(CAGE, case=False, na=False, regex=False)].copy()
+
+# Cached, cleaned Nicolas Cage subset; filtering first means only his rows get normalized.
+# Keyed on the path rather than a DataFrame, so a rerun does not hash any frames
+@st.cache_data(show_spinner=False)
+def get_cage_movies(file_path):
+    return clean_data(filter_cage_movies(load_data(file_path)))
+
+# One IMDb client per validation thread, so each keeps its HTTP session between lookups
+imdb_clients = threading.local()
+
+def get_imdb():
+    if not hasattr(imdb_clients, 'ia'):
+        imdb_clients.ia = IMDb()
+    return imdb_clients.ia
+
+# IMDb year of the Nicolas Cage movie with this title, persisted to disk across sessions
+@st.cache_data(persist='disk', show_spinner=False)
+def lookup_cage_year(title):
+    ia = get_imdb()
+    for movie in ia.search_movie(title):
+        # Fetching full details is a page load per result; skip results for other titles
+        if movie.get('title', '').casefold() != title.casefold():
+            continue
+        ia.update(movie)
+        if any(person['name'] == CAGE for person in movie.get('cast', [])):
+            return movie.get('year')
     return None
 
+# Validate movie years using IMDb; runs in a worker thread, so a final failure is raised, not shown
+def validate_year(title):
+    for attempt in range(3):
+        try:
+            return lookup_cage_year(title)
+        except IMDbDataAccessError:
+            time.sleep(2 ** attempt)  # Back off instead of hammering a throttling IMDb
+    return lookup_cage_year(title)
+
 def validate_years(df):
-    validated_years = []
+    # Only rows with a missing or implausible year are worth a round-trip to IMDb
+    suspect = df['Year'].isna() | (df['Year'] < 1900) | (df['Year'] > CURRENT_YEAR + 5)
+    to_validate = df.loc[suspect, 'Title']
+    titles = to_validate.unique()  # A title repeated across rows is looked up once
+    if len(titles) == 0:
+        return df
+    validated_years = {}
     progress_bar = st.progress(0)  # Initialize a single progress bar
-    total = len(df)
-
-    def update_progress(result):
-        validated_years.append(result)
-        progress_bar.progress(len(validated_years) / total)
-
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(validate_year, row) for _, row in df.iterrows()]
-        for future in futures:
-            result = future.result()
-            update_progress(result)
-
-    df['Validated Year'] = validated_years
-    df['Year'] = df['Validated Year'].combine_first(df['Year'])
-    df.drop(columns=['Validated Year'], inplace=True)
+    total = len(titles)
+
+    # A few workers keep IMDb from answering with 503s; more only adds retries
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = {executor.submit(validate_year, title): title for title in titles}
+        # Advance as lookups finish instead of waiting on them in submission order
+        for done, future in enumerate(as_completed(futures), start=1):
+            title = futures[future]
+            try:
+                validated_years[title] = future.result()
+            except IMDbDataAccessError as e:
+                # Worker threads have no script context, so errors are reported from here
+                st.error(f"Error accessing data for {title}: {e}")
+            progress_bar.progress(done / total)
+
+    # Titles IMDb could not confirm keep the year from the dataset
+    validated = to_validate.map(validated_years).astype('Int16')
+    df['Year'] = validated.reindex(df.index).combine_first(df['Year'])
     return df
 
 # Create a new column for 5-year intervals
 def create_year_intervals(df):
     df = df.dropna(subset=['Year'])  # Drop rows where 'Year' is NaN
-    df['Year Interval'] = (df['Year'] // 5) * 5
-    df['Year Interval'] = df['Year Interval'].astype(int)
+    df['Year Interval'] = (df['Year'].to_numpy(dtype=np.int16) // 5) * 5
     return df
 
+# Group by `key` and take the mean or sum of each column in `agg` with NumPy's bincount kernel
+def aggregate_by(df, key, agg):
+    codes, groups = pd.factorize(df[key], sort=True)
+    result = {}
+    for column, how in agg.items():
+        values = df[column].to_numpy(dtype='float64', na_value=np.nan)
+        present = (codes >= 0) & ~np.isnan(values)
+        totals = np.bincount(codes[present], weights=values[present], minlength=len(groups))
+        if how == 'mean':
+            with np.errstate(invalid='ignore'):
+                totals = totals / np.bincount(codes[present], minlength=len(groups))
+        result[column] = totals
+    return pd.DataFrame(result, index=pd.Index(np.asarray(groups), name=key))
+
 # Calculate the number of complete decades
 def calculate_decades(df):
     earliest_year = df['Year'].min()
@@ -82,20 +174,87 @@ def calculate_decades(df):
     decades = (latest_year - earliest_year + 1) // 10
     return decades, earliest_year, latest_year
 
+# Count each title's genre once and derive the top genres from the same counts
+@st.cache_data
+def genre_stats(df):
+    genre_counts = df.drop_duplicates('Title')['Genre'].value_counts()
+    # Categorical counts include unused categories and would make seaborn plot in category order
+    genre_counts = genre_counts[genre_counts > 0]
+    genre_counts.index = genre_counts.index.astype(str)
+    return genre_counts, genre_counts.idxmax(), genre_counts.nlargest(3).index.tolist()
+
+# Rasterize a figure once, the way st.pyplot does, and free it
+def render_png(fig):
+    image = io.BytesIO()
+    fig.savefig(image, format='png', bbox_inches='tight', dpi=200)
+    plt.close(fig)
+    return image.getvalue()
+
+# Chart builders take plain tuples as cache keys and return the rendered PNG bytes
+@st.cache_data
+def plot_genre_distribution(genres, counts):
+    fig, ax = plt.subplots()
+    sns.barplot(x=list(counts), y=list(genres), ax=ax, palette='viridis')
+    ax.set_title('Genre Distribution')
+    ax.set_xlabel('Number of Movies')
+    ax.set_ylabel('Genre')
+
+    for i, v in enumerate(counts):
+        ax.text(v + 0.5, i, str(v), color='black', va='center')
+
+    return render_png(fig)
+
+@st.cache_data
+def plot_ratings_distribution(labels, counts):
+    fig, ax = plt.subplots()
+    sns.barplot(x=list(labels), y=list(counts), ax=ax, palette='viridis', edgecolor='black')
+    ax.set_title('Ratings Distribution')
+    ax.set_xlabel('Rating')
+    ax.set_ylabel('Number of Movies')
+
+    for i, v in enumerate(counts):
+        ax.text(i, v + 0.1, str(v), color='black', ha='center')
+
+    return render_png(fig)
+
+# Bars on the left axis with a red line on a second y axis, both labelled with their values
+@st.cache_data
+def plot_bars_with_line(labels, bar_values, line_values, bar_label, line_label, xlabel, title, whole_bar_labels=False):
+    fig, ax1 = plt.subplots()
+    sns.barplot(x=list(labels), y=list(bar_values), ax=ax1, palette='viridis')
+    ax2 = ax1.twinx()
+    sns.lineplot(x=list(labels), y=list(line_values), ax=ax2, color='red', marker='o', linestyle='-', linewidth=2)
+
+    ax1.set_ylabel(bar_label)
+    ax2.set_ylabel(line_label)
+    ax1.set_xlabel(xlabel)
+    ax1.set_title(title)
+
+    for i, v in enumerate(bar_values):
+        if whole_bar_labels:
+            ax1.text(i, v + 0.5, f'{int(v)}', color='black', ha='center')
+        else:
+            ax1.text(i, v + 0.1, f'{v:.1f}', color='black', ha='center')
+
+    for i, v in enumerate(line_values):
+        ax2.text(i, v, f'{int(v)}', color='red', ha='center')
+
+    return render_png(fig)
+
 # Main function to run the app
 def main():
-    df = load_data('imdb-movies-dataset.csv')  # Ensure the file is in the same directory as this script
-    df = clean_data(df)
-
     # Filter rows where Nicolas Cage is mentioned in the Cast
-    cage_movies = df[df['Cast'].str.contains('Nicolas Cage', case=False, na=False)].copy()
-    
-    # Validate years for Nicolas Cage movies
-    with st.spinner('Validating movie years against IMDb...'):
-        start_time = time.time()
-        cage_movies = validate_years(cage_movies)
-        end_time = time.time()
-        st.success(f'Validation completed in {end_time - start_time:.2f} seconds.')
+    cage_movies = get_cage_movies('imdb-movies-dataset.csv')  # Ensure the file is in the same directory as this script
+
+    upcoming_movies = cage_movies[cage_movies['Year'] > CURRENT_YEAR]
+
+    # Validate years for Nicolas Cage movies; it goes over the network, so only on request
+    if st.sidebar.checkbox('Validate years via IMDb'):
+        with st.spinner('Validating movie years against IMDb...'):
+            start_time = time.time()
+            cage_movies = validate_years(cage_movies)
+            end_time = time.time()
+            st.success(f'Validation completed in {end_time - start_time:.2f} seconds.')
 
     cage_movies = create_year_intervals(cage_movies)
 
@@ -107,64 +266,38 @@ def main():
     st.image("https://m.media-amazon.com/images/M/MV5BMzY5YTYwODAtZjY4Yi00OGY5LTk0MTAtNWRhNDc1NWQ4ZGI1XkEyXkFqcGdeQXVyMTUzMTg2ODkz._V1_QL75_UX500_CR0,0,500,281_.jpg", caption="Nicolas Cage iconic performances")
 
     st.write(f"Nicolas Cage is one of Hollywood's most enigmatic and versatile actors. With a career spanning {decade_text} (from {earliest_year} to {latest_year}), he's played a wide range of characters in a variety of genres.")
-    
-    cage_movies['Year'] = pd.to_numeric(cage_movies['Year'], errors='coerce')
-    cage_movies = create_year_intervals(cage_movies)
 
-    # Calculate the top genre dynamically
-    unique_genres = cage_movies[['Title', 'Genre']].drop_duplicates()
-    genre_counts = unique_genres['Genre'].value_counts()
-    top_genre = genre_counts.idxmax()
+    # Calculate the top genres dynamically
+    genre_counts, top_genre, top_genres = genre_stats(cage_movies)
 
     total_movies = len(cage_movies)
-    top_genre_count = cage_movies[cage_movies['Genre'] == top_genre].shape[0]
-    first_movie = cage_movies.sort_values(by='Year').iloc[0]
+    top_genre_count = genre_counts[top_genre]
+    first_movie = cage_movies.loc[cage_movies['Year'].idxmin()]
     first_movie_year = int(first_movie['Year'])
     first_movie_title = first_movie['Title']
 
-    current_year = pd.to_datetime('now').year
-    upcoming_movies = df[(df['Year'] >= current_year + 1) & (df['Cast'].str.contains('Nicolas Cage', case=False, na=False))]
-
     summary_paragraph = f"""
     During the mentioned period, he performed in {total_movies} movies (but there are more!). His main genre is {top_genre}, having been part of {top_genre_count} movies in this genre. 
     He first appeared in a movie in the year {first_movie_year}, with the title "{first_movie_title}". 
     """
 
     if not upcoming_movies.empty:
-        summary_paragraph += "Here are his future premiers:\n\n"
-        for idx, movie in upcoming_movies.iterrows():
-            movie_title = movie['Title']
-            movie_year = int(movie['Year'])
-            movie_url = movie.get('url', '#')
-            summary_paragraph += f"- [{movie_title}]({movie_url}) ({movie_year})\n"
+        movie_urls = upcoming_movies['url'].fillna('#') if 'url' in upcoming_movies else '#'
+        movie_links = '- [' + upcoming_movies['Title'] + '](' + movie_urls + ') (' + upcoming_movies['Year'].astype(int).astype(str) + ')'
+        summary_paragraph += "Here are his future premiers:\n\n" + movie_links.str.cat(sep="\n") + "\n"
     else:
-        summary_paragraph += "There are no movies scheduled for 2025 or later."
+        summary_paragraph += f"There are no movies scheduled for {CURRENT_YEAR + 1} or later."
 
     st.write(summary_paragraph)
 
     st.subheader('From Ka-Boom to Ha-ha')
     st.write("Nicolas Cage has never shied away from experimenting with different genres. From action-packed thrillers to dramatic roles, let's see which genres he has dominated over the years.")
 
-    genre_counts = unique_genres['Genre'].value_counts()
-    top_genre = genre_counts.idxmax()
-    genre_counts = genre_counts.reindex([top_genre] + [g for g in genre_counts.index if g != top_genre]).dropna()
-
-    fig, ax = plt.subplots()
-    sns.barplot(x=genre_counts.values, y=genre_counts.index, ax=ax, palette='viridis')
-    ax.set_title('Genre Distribution')
-    ax.set_xlabel('Number of Movies')
-    ax.set_ylabel('Genre')
-
-    for i, v in enumerate(genre_counts.values):
-        ax.text(v + 0.5, i, str(v), color='black', va='center')
-
-    st.pyplot(fig)
-
-    top_genres = genre_counts.nlargest(3).index.tolist()
+    st.image(plot_genre_distribution(tuple(genre_counts.index), tuple(genre_counts.tolist())), width='stretch')
 
     st.subheader('Top Rated Movies')
     st.write("Nicolas Cage has undoubtedly delivered some stellar performances. Here are the top-rated movies starring Nicolas Cage.")
-    top_rated = cage_movies.sort_values(by='Rating', ascending=False).head(10)
+    top_rated = cage_movies.nlargest(10, 'Rating')
     top_rated['Year'] = top_rated['Year'].astype(int)
     top_rated['Rating'] = top_rated['Rating'].round(1)
     top_rated = top_rated[['Title', 'Year', 'Rating']].reset_index(drop=True)
@@ -174,90 +307,40 @@ def main():
 
     st.write("Cage's movies have seen a range of ratings over the years. Let's take a look at how his movies are rated and see the distribution of ratings.")
 
-    rating_bins = pd.cut(cage_movies['Rating'], bins=[2, 3, 4, 5, 6, 7, 8], right=False)
-    rating_counts = rating_bins.value_counts().sort_index()
-
-    labels = [f'{int(bin.left)}' for bin in rating_counts.index]
-
-    fig, ax = plt.subplots()
-    sns.barplot(x=labels, y=rating_counts.values, ax=ax, palette='viridis', edgecolor='black')
-    ax.set_title('Ratings Distribution')
-    ax.set_xlabel('Rating')
-    ax.set_ylabel('Number of Movies')
+    ratings = cage_movies['Rating'].dropna().to_numpy()
+    # np.histogram closes its last bin, so leave out 8.0 as the half-open [7, 8) bin always did
+    rating_counts, edges = np.histogram(ratings[ratings < 8], bins=[2, 3, 4, 5, 6, 7, 8])
 
-    for i, v in enumerate(rating_counts.values):
-        ax.text(i, v + 0.1, str(v), color='black', ha='center')
+    labels = tuple(f'{int(edge)}' for edge in edges[:-1])
 
-    st.pyplot(fig)
+    st.image(plot_ratings_distribution(labels, tuple(rating_counts.tolist())), width='stretch')
 
     st.subheader('Top 3 Genres Ranked by Ratings')
     st.write("Let's see how the top 3 genres for Nicolas Cage's movies rank based on their average ratings and average votes per movie. Numerical ratings by users, averaged on platforms like IMDb and Rotten Tomatoes, are relevant as they reflect general audience opinion and contribute to the movie's overall rating and audience score.")
-    top_genre_ratings_votes = cage_movies[cage_movies['Genre'].isin(top_genres)].groupby('Genre').agg({'Rating': 'mean', 'Votes': 'mean'}).loc[top_genres]
-
-    fig, ax1 = plt.subplots()
-    sns.barplot(x=top_genre_ratings_votes.index, y=top_genre_ratings_votes['Rating'], ax=ax1, palette='viridis')
-    ax2 = ax1.twinx()
-    sns.lineplot(x=top_genre_ratings_votes.index, y=top_genre_ratings_votes['Votes'], ax=ax2, color='red', marker='o', linestyle='-', linewidth=2)
-
-    ax1.set_ylabel('Average Rating')
-    ax2.set_ylabel('Average Votes per Movie')
-    ax1.set_xlabel('Genre')
-    ax1.set_title('Top 3 Genres Ranked by Ratings and Votes')
+    top_genre_ratings_votes = aggregate_by(cage_movies[cage_movies['Genre'].isin(top_genres)], 'Genre', {'Rating': 'mean', 'Votes': 'mean'}).loc[top_genres]
 
-    for i, v in enumerate(top_genre_ratings_votes['Rating']):
-        ax1.text(i, v + 0.1, f'{v:.1f}', color='black', ha='center')
-
-    for i, v in enumerate(top_genre_ratings_votes['Votes']):
-        ax2.text(i, v, f'{int(v)}', color='red', ha='center')
-
-    st.pyplot(fig)
+    st.image(plot_bars_with_line(
+        tuple(top_genre_ratings_votes.index), tuple(top_genre_ratings_votes['Rating'].tolist()), tuple(top_genre_ratings_votes['Votes'].tolist()),
+        'Average Rating', 'Average Votes per Movie', 'Genre', 'Top 3 Genres Ranked by Ratings and Votes'), width='stretch')
 
     st.subheader('Critical Reception by 5-Year Intervals')
     st.write("Beyond audience ratings, let's take a look at the critical reception of Nicolas Cage's movies through their Metascores and review counts over 5-year intervals. Detailed assessments by critics or users, aggregated into scores by platforms like Rotten Tomatoes and Metacritic, are relevant as they provide in-depth analysis and qualitative feedback, influencing the overall critical consensus and Metascore.")
 
-    avg_metascore_reviews_by_interval = cage_movies.groupby('Year Interval').agg({'Metascore': 'mean', 'Review Count': 'sum'}).dropna()
-
-    fig, ax1 = plt.subplots()
-    sns.barplot(x=avg_metascore_reviews_by_interval.index.astype(str), y=avg_metascore_reviews_by_interval['Metascore'], ax=ax1, palette='viridis')
-    ax2 = ax1.twinx()
-    sns.lineplot(x=avg_metascore_reviews_by_interval.index.astype(str), y=avg_metascore_reviews_by_interval['Review Count'], ax=ax2, color='red', marker='o', linestyle='-', linewidth=2)
-
-    ax1.set_ylabel('Average Metascore')
-    ax2.set_ylabel('Total Review Count')
-    ax1.set_xlabel('Year Interval')
-    ax1.set_title('Critical Reception by 5-Year Intervals')
-
-    for i, (x, y) in enumerate(zip(avg_metascore_reviews_by_interval.index, avg_metascore_reviews_by_interval['Metascore'])):
-        ax1.text(i, y + 0.5, f'{int(y)}', color='black', ha='center')
+    avg_metascore_reviews_by_interval = aggregate_by(cage_movies, 'Year Interval', {'Metascore': 'mean', 'Review Count': 'sum'}).dropna()
 
-    for i, (x, y) in enumerate(zip(avg_metascore_reviews_by_interval.index, avg_metascore_reviews_by_interval['Review Count'])):
-        ax2.text(i, y, f'{int(y)}', color='red', ha='center')
-
-    st.pyplot(fig)
+    st.image(plot_bars_with_line(
+        tuple(avg_metascore_reviews_by_interval.index.astype(str)), tuple(avg_metascore_reviews_by_interval['Metascore'].tolist()), tuple(avg_metascore_reviews_by_interval['Review Count'].tolist()),
+        'Average Metascore', 'Total Review Count', 'Year Interval', 'Critical Reception by 5-Year Intervals', whole_bar_labels=True), width='stretch')
 
     st.subheader(f'{top_genre} Genre: Ratings and Reviews by 5-Year Intervals')
     st.write(f"Let's dive deeper into the {top_genre}, which is Nic's most dominant genre and see how the ratings and reviews evolved over 5-year intervals.")
 
     top_genre_movies = cage_movies[cage_movies['Genre'] == top_genre]
-    avg_rating_reviews_by_interval = top_genre_movies.groupby('Year Interval').agg({'Rating': 'mean', 'Review Count': 'sum'}).dropna()
-
-    fig, ax1 = plt.subplots()
-    sns.barplot(x=avg_rating_reviews_by_interval.index.astype(str), y=avg_rating_reviews_by_interval['Rating'], ax=ax1, palette='viridis')
-    ax2 = ax1.twinx()
-    sns.lineplot(x=avg_rating_reviews_by_interval.index.astype(str), y=avg_rating_reviews_by_interval['Review Count'], ax=ax2, color='red', marker='o', linestyle='-', linewidth=2)
-
-    ax1.set_ylabel('Average Rating')
-    ax2.set_ylabel('Total Review Count')
-    ax1.set_xlabel('Year Interval')
-    ax1.set_title(f'{top_genre} Genre: Ratings and Reviews by 5-Year Intervals')
-
-    for i, (x, y) in enumerate(zip(avg_rating_reviews_by_interval.index, avg_rating_reviews_by_interval['Rating'])):
-        ax1.text(i, y + 0.1, f'{y:.1f}', color='black', ha='center')
-
-    for i, (x, y) in enumerate(zip(avg_rating_reviews_by_interval.index, avg_rating_reviews_by_interval['Review Count'])):
-        ax2.text(i, y, f'{int(y)}', color='red', ha='center')
+    avg_rating_reviews_by_interval = aggregate_by(top_genre_movies, 'Year Interval', {'Rating': 'mean', 'Review Count': 'sum'}).dropna()
 
-    st.pyplot(fig)
+    st.image(plot_bars_with_line(
+        tuple(avg_rating_reviews_by_interval.index.astype(str)), tuple(avg_rating_reviews_by_interval['Rating'].tolist()), tuple(avg_rating_reviews_by_interval['Review Count'].tolist()),
+        'Average Rating', 'Total Review Count', 'Year Interval', f'{top_genre} Genre: Ratings and Reviews by 5-Year Intervals'), width='stretch')
 
     st.subheader('Summary and Conclusions')
     st.write(f"""